@@ -15,7 +15,7 @@ fi
 echo "🔧 Installing dependencies..."
 apt update
 apt install -y python3 python3-pip
-pip3 install psutil colorama
+pip3 install colorama
 
 # Copy files
 echo "📁 Copying files..."
@@ -1,6 +1,5 @@
 
 #!/usr/bin/env python3
-import psutil
 import os
 import time
 import logging
@@ -11,12 +10,20 @@ from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 import configparser
 import argparse
+import re
 import socket
-from collections import deque
+import sys
+import queue
+import threading
 
 # Initialize colorama
 init(autoreset=True)
 
+# Log records never use thread/process fields, skip collecting them per record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
 # Configuration setup
 CONFIG_FILE = '/etc/system_monitor.conf'
 DEFAULT_CONFIG = f"""[Thresholds]
@@ -72,12 +79,159 @@ interval = 5
 hostname = {socket.gethostname()}
 """
 
-# Network history for rate calculation
-net_history = {
-    'sent': deque(maxlen=10),
-    'recv': deque(maxlen=10),
-    'timestamp': deque(maxlen=10)
-}
+# Previous network counter snapshot for rate calculation
+net_prev = {'sent': 0, 'recv': 0, 'timestamp_ns': 0, 'initialized': False}
+
+# Seconds to reuse a statvfs('/') result - disk usage changes slowly
+DISK_CACHE_TTL = 30
+
+# Previous /proc/stat snapshot for CPU percentage calculation
+cpu_prev = {'busy': 0, 'total': 0}
+
+# Cached root filesystem usage
+disk_cache = {'percent': 0.0, 'timestamp': None}
+
+# Persistent /proc file descriptors and their reusable read buffers
+proc_fds = {}
+proc_bufs = {}
+PROC_BUFFER_SIZE = 8192
+
+def read_proc(path):
+    """Read a /proc file from offset 0 into its reusable buffer
+    
+    Returns a memoryview over the bytes read, valid until the next read of path.
+    """
+    fd = proc_fds.get(path)
+    if fd is None:
+        fd = proc_fds[path] = os.open(path, os.O_RDONLY)
+        proc_bufs[path] = bytearray(PROC_BUFFER_SIZE)
+    buf = proc_bufs[path]
+    # seq_file-backed files (e.g. /proc/net/dev) return about a page per read
+    # whatever the buffer size, so only a zero-length read means end of file
+    n = 0
+    while True:
+        if n == len(buf):
+            buf = proc_bufs[path] = buf + bytearray(len(buf))
+        count = os.preadv(fd, [memoryview(buf)[n:]], n)
+        if not count:
+            break
+        n += count
+    return memoryview(buf)[:n]
+
+def cleanup():
+    """Close the persistent /proc file descriptors"""
+    for fd in proc_fds.values():
+        try:
+            os.close(fd)
+        except OSError:
+            pass
+    proc_fds.clear()
+    proc_bufs.clear()
+
+def parse_uint(buf, pos):
+    """Parse the unsigned integer at or after pos in a bytes buffer
+    
+    Returns (value, pos) with pos just past the last digit. Works on the raw
+    buffer so no intermediate str/bytes objects are created.
+    """
+    end = len(buf)
+    while pos < end and not 48 <= buf[pos] <= 57:
+        pos += 1
+    value = 0
+    while pos < end and 48 <= buf[pos] <= 57:
+        value = value * 10 + buf[pos] - 48
+        pos += 1
+    return value, pos
+
+def read_cpu_times():
+    """Return (busy, total) jiffies from the aggregate cpu line of /proc/stat"""
+    buf = read_proc('/proc/stat')
+    # The aggregate line comes first: "cpu  user nice system idle iowait irq softirq steal ..."
+    pos = 3
+    total = 0
+    for i in range(8):
+        value, pos = parse_uint(buf, pos)
+        total += value
+        # idle + iowait are the only non-busy states
+        if i == 3:
+            idle = value
+        elif i == 4:
+            idle += value
+    return total - idle, total
+
+def read_meminfo_field(buf, name):
+    """Return the kB value of a /proc/meminfo field, or None if it is missing"""
+    # Search the underlying bytearray, bounded to the bytes actually read
+    data, end = buf.obj, len(buf)
+    # Match at a line start so e.g. b'Cached:' doesn't hit b'SwapCached:'
+    if data.startswith(name, 0, end):
+        pos = 0
+    else:
+        pos = data.find(b'\n' + name, 0, end)
+        if pos < 0:
+            return None
+        pos += 1
+    return parse_uint(buf, pos + len(name))[0]
+
+def read_memory_percent():
+    """Return used memory percentage from /proc/meminfo"""
+    buf = read_proc('/proc/meminfo')
+    mem_total = read_meminfo_field(buf, b'MemTotal:')
+    if not mem_total:
+        return 0.0
+    mem_available = read_meminfo_field(buf, b'MemAvailable:')
+    if mem_available is None:
+        # Kernels before 3.14 lack MemAvailable, estimate it like psutil does
+        mem_available = sum(read_meminfo_field(buf, name) or 0
+                            for name in (b'MemFree:', b'Buffers:', b'Cached:'))
+    return round((mem_total - mem_available) / mem_total * 100, 1)
+
+def read_disk_percent(path='/'):
+    """Return used disk percentage for path, cached for DISK_CACHE_TTL seconds"""
+    # Monotonic clock so an NTP step can't keep serving a stale value
+    current_time = time.monotonic()
+    if disk_cache['timestamp'] is not None and current_time - disk_cache['timestamp'] < DISK_CACHE_TTL:
+        return disk_cache['percent']
+
+    st = os.statvfs(path)
+    # Same calculation as df: reserved blocks are not available to users
+    used = (st.f_blocks - st.f_bfree) * st.f_frsize
+    total_user = used + st.f_bavail * st.f_frsize
+    percent = round(used / total_user * 100, 1) if total_user else 0.0
+
+    disk_cache['percent'] = percent
+    disk_cache['timestamp'] = current_time
+    return percent
+
+# Per-interface line of /proc/net/dev: receive bytes, 7 more receive fields, transmit bytes
+NET_DEV_RE = re.compile(rb'^\s*[^:\s]+:\s*(\d+)(?:\s+\d+){7}\s+(\d+)', re.M)
+
+def read_net_counters():
+    """Return total (bytes_sent, bytes_recv) across all interfaces from /proc/net/dev"""
+    bytes_sent = bytes_recv = 0
+    for match in NET_DEV_RE.finditer(read_proc('/proc/net/dev')):
+        bytes_recv += int(match.group(1))
+        bytes_sent += int(match.group(2))
+    return bytes_sent, bytes_recv
+
+def sample_system():
+    """Collect CPU, memory, disk and network counters in a single pass over /proc
+    
+    CPU usage is measured since the previous call; the first call only primes it.
+    """
+    busy, total = read_cpu_times()
+    busy_diff = busy - cpu_prev['busy']
+    total_diff = total - cpu_prev['total']
+    cpu_prev['busy'], cpu_prev['total'] = busy, total
+
+    bytes_sent, bytes_recv = read_net_counters()
+    return {
+        'cpu': round(busy_diff / total_diff * 100, 1) if total_diff > 0 else 0.0,
+        'memory': read_memory_percent(),
+        'disk': read_disk_percent('/'),
+        'bytes_sent': bytes_sent,
+        'bytes_recv': bytes_recv
+    }
 
 def load_config():
     """Load configuration from file with fallback to defaults"""
@@ -93,29 +247,41 @@ def load_config():
     # Get password from environment variable
     email_password = os.getenv('EMAIL_PASSWORD')
     
+    # Resolve the local IP once; a DNS lookup per alert can block for seconds
+    try:
+        local_ip = socket.gethostbyname(socket.gethostname())
+    except socket.gaierror:
+        local_ip = 'unknown'
+    
     # Set up log rotation if specified
     log_file = config.get('Logging', 'log_file', fallback='/var/log/system_monitor.log')
     max_size = config.getint('Logging', 'max_size', fallback=10) * 1024 * 1024  # Convert to bytes
     backup_count = config.getint('Logging', 'backup_count', fallback=5)
     
+    email_sender = config.get('Email', 'sender', fallback='')
+    email_receiver = config.get('Email', 'receiver', fallback='')
+    smtp_server = config.get('Email', 'smtp_server', fallback='')
+    
     return {
         'cpu_threshold': config.getfloat('Thresholds', 'cpu', fallback=85),
         'mem_threshold': config.getfloat('Thresholds', 'memory', fallback=80),
         'disk_threshold': config.getfloat('Thresholds', 'disk', fallback=90),
         'net_sent_threshold': config.getfloat('Thresholds', 'net_sent', fallback=10),
         'net_recv_threshold': config.getfloat('Thresholds', 'net_recv', fallback=10),
-        'email_sender': config.get('Email', 'sender', fallback=''),
-        'email_receiver': config.get('Email', 'receiver', fallback=''),
+        'email_sender': email_sender,
+        'email_receiver': email_receiver,
         'email_subject': config.get('Email', 'subject', fallback='System Alert'),
-        'smtp_server': config.get('Email', 'smtp_server', fallback=''),
+        'smtp_server': smtp_server,
         'smtp_port': config.getint('Email', 'smtp_port', fallback=587),
         'email_username': config.get('Email', 'username', fallback=''),
         'email_password': email_password,
+        'email_enabled': bool(email_sender and email_receiver and smtp_server and email_password),
         'log_file': log_file,
         'max_log_size': max_size,
         'log_backup_count': backup_count,
         'interval': config.getint('General', 'interval', fallback=5),
-        'hostname': config.get('General', 'hostname', fallback=socket.gethostname())
+        'hostname': config.get('General', 'hostname', fallback=socket.gethostname()),
+        'local_ip': local_ip
     }
 
 def setup_logger(config):
@@ -135,7 +301,8 @@ def setup_logger(config):
         backupCount=config['log_backup_count']
     )
     file_handler.setFormatter(logging.Formatter(
-        '%(asctime)s %(levelname)s: %(message)s'
+        '%(asctime)s %(levelname)s: %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
     ))
     logger.addHandler(file_handler)
     
@@ -147,131 +314,82 @@ def setup_logger(config):
     
     return logger
 
+# Console color formats indexed by severity: normal, warning, critical
+COLOR_FORMATS = (
+    f"{Fore.GREEN}%s{Style.RESET_ALL}",
+    f"{Fore.YELLOW}%s{Style.RESET_ALL}",
+    f"{Fore.RED}%s{Style.RESET_ALL}"
+)
+
 def colorize(value, threshold):
     """Colorize output based on threshold values"""
-    if value > threshold:
-        return f"{Fore.RED}{value}{Style.RESET_ALL}"
-    elif value > threshold - 10:
-        return f"{Fore.YELLOW}{value}{Style.RESET_ALL}"
-    return f"{Fore.GREEN}{value}{Style.RESET_ALL}"
+    return COLOR_FORMATS[(value > threshold - 10) + (value > threshold)] % value
 
-def get_network_rates():
+def get_network_rates(bytes_sent, bytes_recv):
     """Calculate network transfer rates in MB/s"""
-    net_io = psutil.net_io_counters()
-    current_time = time.time()
+    # Monotonic clock so NTP adjustments can't produce bogus rate spikes
+    current_ns = time.monotonic_ns()
     
-    # Initialize history
-    if not net_history['timestamp']:
-        net_history['sent'].append(net_io.bytes_sent)
-        net_history['recv'].append(net_io.bytes_recv)
-        net_history['timestamp'].append(current_time)
+    # Initialize snapshot
+    if not net_prev['initialized']:
+        net_prev['sent'] = bytes_sent
+        net_prev['recv'] = bytes_recv
+        net_prev['timestamp_ns'] = current_ns
+        net_prev['initialized'] = True
         return 0.0, 0.0
     
-    # Calculate rates
-    time_diff = current_time - net_history['timestamp'][0]
-    sent_diff = net_io.bytes_sent - net_history['sent'][0]
-    recv_diff = net_io.bytes_recv - net_history['recv'][0]
+    # Calculate rates since the previous sample, in integers until the final divide
+    time_diff_ns = current_ns - net_prev['timestamp_ns']
+    sent_diff = bytes_sent - net_prev['sent']
+    recv_diff = bytes_recv - net_prev['recv']
     
-    # Convert to MB/s (bytes to MB: / (1024*1024))
-    sent_rate = (sent_diff / (1024 * 1024)) / time_diff if time_diff > 0 else 0
-    recv_rate = (recv_diff / (1024 * 1024)) / time_diff if time_diff > 0 else 0
+    # Convert to MB/s: bytes * 1e9 / (ns * 1024 * 1024)
+    if time_diff_ns > 0:
+        divisor = time_diff_ns * 1048576
+        sent_rate = sent_diff * 1_000_000_000 / divisor
+        recv_rate = recv_diff * 1_000_000_000 / divisor
+    else:
+        sent_rate = recv_rate = 0.0
     
-    # Update history
-    net_history['sent'].append(net_io.bytes_sent)
-    net_history['recv'].append(net_io.bytes_recv)
-    net_history['timestamp'].append(current_time)
+    # Update snapshot
+    net_prev['sent'] = bytes_sent
+    net_prev['recv'] = bytes_recv
+    net_prev['timestamp_ns'] = current_ns
     
     return sent_rate, recv_rate
 
-def send_email_alert(config, metrics, alerts):
-    """Send detailed HTML email alert"""
-    if not all([
-        config['email_sender'],
-        config['email_receiver'], 
-        config['smtp_server'], 
-        config['email_password']
-    ]):
-        logging.error("Email configuration incomplete. Skipping email alert.")
-        return
-
-    try:
-        # Create HTML email content
-        msg = MIMEMultipart('alternative')
-        msg['From'] = config['email_sender']
-        msg['To'] = config['email_receiver']
-        msg['Subject'] = f"{config['email_subject']} - {config['hostname']}"
-        
-        # System information
-        sys_info = f"""
-        <p>
-            <strong>System:</strong> {config['hostname']} ({socket.gethostbyname(socket.gethostname())})<br>
-            <strong>Time:</strong> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-        </p>
-        """
-        
-        # Build alerts section
-        alerts_section = ""
-        if alerts:
-            alerts_section = "<h3>Active Alerts:</h3><ul>"
-            for alert in alerts:
-                alerts_section += f"<li style='color: #d9534f;'>{alert}</li>"
-            alerts_section += "</ul>"
-        
-        # Build metrics table
-        def status_cell(value, threshold):
-            if value > threshold:
-                return f"<td style='border: 1px solid #ddd; padding: 8px; color: #d9534f; font-weight: bold;'>CRITICAL</td>"
-            elif value > threshold - 10:
-                return f"<td style='border: 1px solid #ddd; padding: 8px; color: #f0ad4e; font-weight: bold;'>WARNING</td>"
-            return "<td style='border: 1px solid #ddd; padding: 8px;'>Normal</td>"
-        
-        metrics_table = """
-        <h3>Resource Metrics:</h3>
-        <table style='border-collapse: collapse; width: 100%;'>
-            <tr style='background-color: #4CAF50; color: white;'>
-                <th style='border: 1px solid #ddd; padding: 8px; text-align: left;'>Metric</th>
-                <th style='border: 1px solid #ddd; padding: 8px; text-align: left;'>Value</th>
-                <th style='border: 1px solid #ddd; padding: 8px; text-align: left;'>Threshold</th>
-                <th style='border: 1px solid #ddd; padding: 8px; text-align: left;'>Status</th>
-            </tr>
-        """
-        
-        metrics_table += f"""
-            <tr>
-                <td style='border: 1px solid #ddd; padding: 8px;'>CPU Usage</td>
-                <td style='border: 1px solid #ddd; padding: 8px;'>{metrics['cpu']:.1f}%</td>
-                <td style='border: 1px solid #ddd; padding: 8px;'>{config['cpu_threshold']}%</td>
-                {status_cell(metrics['cpu'], config['cpu_threshold'])}
-            </tr>
-            <tr style='background-color: #f2f2f2;'>
-                <td style='border: 1px solid #ddd; padding: 8px;'>Memory Usage</td>
-                <td style='border: 1px solid #ddd; padding: 8px;'>{metrics['memory']:.1f}%</td>
-                <td style='border: 1px solid #ddd; padding: 8px;'>{config['mem_threshold']}%</td>
-                {status_cell(metrics['memory'], config['mem_threshold'])}
-            </tr>
-            <tr>
-                <td style='border: 1px solid #ddd; padding: 8px;'>Disk Usage</td>
-                <td style='border: 1px solid #ddd; padding: 8px;'>{metrics['disk']:.1f}%</td>
-                <td style='border: 1px solid #ddd; padding: 8px;'>{config['disk_threshold']}%</td>
-                {status_cell(metrics['disk'], config['disk_threshold'])}
-            </tr>
-            <tr style='background-color: #f2f2f2;'>
-                <td style='border: 1px solid #ddd; padding: 8px;'>Network Sent</td>
-                <td style='border: 1px solid #ddd; padding: 8px;'>{metrics['net_sent']:.2f} MB/s</td>
-                <td style='border: 1px solid #ddd; padding: 8px;'>{config['net_sent_threshold']} MB/s</td>
-                {status_cell(metrics['net_sent'], config['net_sent_threshold'])}
-            </tr>
-            <tr>
-                <td style='border: 1px solid #ddd; padding: 8px;'>Network Received</td>
-                <td style='border: 1px solid #ddd; padding: 8px;'>{metrics['net_recv']:.2f} MB/s</td>
-                <td style='border: 1px solid #ddd; padding: 8px;'>{config['net_recv_threshold']} MB/s</td>
-                {status_cell(metrics['net_recv'], config['net_recv_threshold'])}
-            </tr>
-        </table>
-        """
-        
-        # Compose HTML email
-        html = f"""
+# Monitored metrics: (label, metric key, threshold key, alert text, value format, unit)
+METRICS = (
+    ('CPU Usage', 'cpu', 'cpu_threshold', 'High CPU usage', '%.1f', '%'),
+    ('Memory Usage', 'memory', 'mem_threshold', 'High Memory usage', '%.1f', '%'),
+    ('Disk Usage', 'disk', 'disk_threshold', 'High Disk usage', '%.1f', '%'),
+    ('Network Sent', 'net_sent', 'net_sent_threshold', 'High Network send rate', '%.2f', ' MB/s'),
+    ('Network Received', 'net_recv', 'net_recv_threshold', 'High Network receive rate', '%.2f', ' MB/s')
+)
+
+def check_thresholds(config, metrics):
+    """Return alert messages for every metric above its threshold"""
+    return [f"{alert}: {value_fmt % metrics[key]}{unit}"
+            for _, key, threshold_key, alert, value_fmt, unit in METRICS
+            if metrics[key] > config[threshold_key]]
+
+# Precomputed status cells for the email metrics table
+STATUS_CRITICAL = "<td style='border: 1px solid #ddd; padding: 8px; color: #d9534f; font-weight: bold;'>CRITICAL</td>"
+STATUS_WARNING = "<td style='border: 1px solid #ddd; padding: 8px; color: #f0ad4e; font-weight: bold;'>WARNING</td>"
+STATUS_NORMAL = "<td style='border: 1px solid #ddd; padding: 8px;'>Normal</td>"
+
+# One row of the email metrics table
+METRIC_ROW_TEMPLATE = """
+                    <tr%(row_style)s>
+                        <td style='border: 1px solid #ddd; padding: 8px;'>%(label)s</td>
+                        <td style='border: 1px solid #ddd; padding: 8px;'>%(value)s</td>
+                        <td style='border: 1px solid #ddd; padding: 8px;'>%(threshold)s</td>
+                        %(status)s
+                    </tr>"""
+STRIPED_ROW_STYLE = " style='background-color: #f2f2f2;'"
+
+# HTML email body, filled with a single %-substitution per alert
+HTML_TEMPLATE = """
         <html>
         <body style="font-family: Arial, sans-serif; margin: 0; padding: 0;">
             <!-- Header -->
@@ -281,25 +399,172 @@ def send_email_alert(config, metrics, alerts):
             
             <!-- Content Container -->
             <div style="padding: 20px;">
-                {sys_info}
+                <p>
+                    <strong>System:</strong> %(hostname)s (%(local_ip)s)<br>
+                    <strong>Time:</strong> %(time)s
+                </p>
                 
                 <!-- Alerts Section -->
                 <div style="margin: 20px 0; padding: 15px; border-left: 4px solid #d9534f; background-color: #f8f8f8;">
-                    {alerts_section if alerts else "<p>No active alerts</p>"}
+                    %(alerts_section)s
                 </div>
                 
                 <!-- Metrics Table -->
-                {metrics_table}
+                <h3>Resource Metrics:</h3>
+                <table style='border-collapse: collapse; width: 100%%;'>
+                    <tr style='background-color: #4CAF50; color: white;'>
+                        <th style='border: 1px solid #ddd; padding: 8px; text-align: left;'>Metric</th>
+                        <th style='border: 1px solid #ddd; padding: 8px; text-align: left;'>Value</th>
+                        <th style='border: 1px solid #ddd; padding: 8px; text-align: left;'>Threshold</th>
+                        <th style='border: 1px solid #ddd; padding: 8px; text-align: left;'>Status</th>
+                    </tr>
+%(metric_rows)s
+                </table>
                 
                 <!-- Footer -->
                 <div style="margin-top: 30px; padding-top: 15px; border-top: 1px solid #eee; color: #6c757d; font-size: 0.9em;">
                     <p>Generated by Linux System Monitor</p>
-                    <p>Next check in {config['interval']} seconds</p>
+                    <p>Next check in %(interval)s seconds</p>
                 </div>
             </div>
         </body>
         </html>
         """
+
+# Composed alert emails waiting for the background SMTP worker
+EMAIL_QUEUE_SIZE = 16
+# Seconds before a blocked SMTP operation fails, so a silently dropped idle connection can't stall the worker
+SMTP_TIMEOUT = 30
+email_queue = queue.Queue(maxsize=EMAIL_QUEUE_SIZE)
+email_worker = None
+
+class SmtpSession:
+    """SMTP connection kept open across alerts, reconnected when the server drops it"""
+
+    def __init__(self, config):
+        self.config = config
+        self.conn = None
+
+    def _connect(self):
+        conn = smtplib.SMTP(self.config['smtp_server'], self.config['smtp_port'], timeout=SMTP_TIMEOUT)
+        conn.starttls()
+        conn.login(self.config['email_username'], self.config['email_password'])
+        self.conn = conn
+
+    def _reconnect(self):
+        self.close()
+        self._connect()
+
+    def send(self, msg):
+        """Send a composed email, reusing the open connection when it is still alive"""
+        if self.conn is not None:
+            try:
+                alive = self.conn.noop()[0] == 250
+            except OSError:
+                # Disconnected or timed out, e.g. idle connection dropped by a NAT or firewall
+                alive = False
+            if not alive:
+                # Skip QUIT on a dead connection, it would only wait for another timeout
+                self.conn.close()
+                self.conn = None
+        try:
+            if self.conn is None:
+                self._connect()
+            self.conn.send_message(msg)
+        except (smtplib.SMTPServerDisconnected, ConnectionError):
+            # Idle connection was closed by the server
+            self._reconnect()
+            self.conn.send_message(msg)
+
+    def close(self):
+        """Close the connection, ignoring errors from an already dead socket"""
+        if self.conn is not None:
+            try:
+                self.conn.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self.conn = None
+
+def email_worker_loop(config):
+    """Deliver queued emails one at a time over a persistent SMTP session"""
+    session = SmtpSession(config)
+    while True:
+        msg = email_queue.get()
+        try:
+            session.send(msg)
+            logging.info("Email alert sent with detailed metrics")
+        except Exception as e:
+            logging.error("Failed to send email alert: %s", e)
+            session.close()
+        finally:
+            email_queue.task_done()
+
+def start_email_worker(config):
+    """Start the background SMTP worker if it is not already running"""
+    global email_worker
+    if email_worker is None:
+        email_worker = threading.Thread(
+            target=email_worker_loop,
+            args=(config,),
+            name='EmailWorker',
+            daemon=True
+        )
+        email_worker.start()
+
+def status_cell(value, threshold):
+    """Return the precomputed status cell for a metric value"""
+    if value > threshold:
+        return STATUS_CRITICAL
+    elif value > threshold - 10:
+        return STATUS_WARNING
+    return STATUS_NORMAL
+
+def send_email_alert(config, metrics, alerts):
+    """Send detailed HTML email alert"""
+    if not config['email_enabled']:
+        logging.error("Email configuration incomplete. Skipping email alert.")
+        return
+
+    try:
+        # Create HTML email content
+        msg = MIMEMultipart('alternative')
+        msg['From'] = config['email_sender']
+        msg['To'] = config['email_receiver']
+        msg['Subject'] = f"{config['email_subject']} - {config['hostname']}"
+        
+        # Build alerts section
+        if alerts:
+            alerts_section = "<h3>Active Alerts:</h3><ul>"
+            for alert in alerts:
+                alerts_section += f"<li style='color: #d9534f;'>{alert}</li>"
+            alerts_section += "</ul>"
+        else:
+            alerts_section = "<p>No active alerts</p>"
+        
+        # Build metrics table rows and plain text lines from the same table
+        metric_rows = []
+        metric_lines = []
+        for i, (label, key, threshold_key, _, value_fmt, unit) in enumerate(METRICS):
+            value = (value_fmt % metrics[key]) + unit
+            threshold = f"{config[threshold_key]}{unit}"
+            metric_rows.append(METRIC_ROW_TEMPLATE % {
+                'row_style': STRIPED_ROW_STYLE if i % 2 else '',
+                'label': label,
+                'value': value,
+                'threshold': threshold,
+                'status': status_cell(metrics[key], config[threshold_key])
+            })
+            metric_lines.append(f"{label}: {value} (Threshold: {threshold})\n")
+        
+        # Compose HTML email in a single substitution pass
+        html = HTML_TEMPLATE % {
+            'hostname': config['hostname'],
+            'local_ip': config['local_ip'],
+            'time': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            'alerts_section': alerts_section,
+            'metric_rows': ''.join(metric_rows),
+            'interval': config['interval']
+        }
         
         # Create plain text version as fallback
         text = f"System Alert on {config['hostname']}\n\n"
@@ -307,11 +572,7 @@ def send_email_alert(config, metrics, alerts):
         for alert in alerts:
             text += f" - {alert}\n"
         text += "\nResource Metrics:\n"
-        text += f"CPU Usage: {metrics['cpu']:.1f}% (Threshold: {config['cpu_threshold']}%)\n"
-        text += f"Memory Usage: {metrics['memory']:.1f}% (Threshold: {config['mem_threshold']}%)\n"
-        text += f"Disk Usage: {metrics['disk']:.1f}% (Threshold: {config['disk_threshold']}%)\n"
-        text += f"Network Sent: {metrics['net_sent']:.2f} MB/s (Threshold: {config['net_sent_threshold']} MB/s)\n"
-        text += f"Network Received: {metrics['net_recv']:.2f} MB/s (Threshold: {config['net_recv_threshold']} MB/s)\n"
+        text += ''.join(metric_lines)
         text += f"\nGenerated at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
         
         # Attach both versions to the email
@@ -320,38 +581,46 @@ def send_email_alert(config, metrics, alerts):
         msg.attach(part1)
         msg.attach(part2)
         
-        # Send email
-        with smtplib.SMTP(config['smtp_server'], config['smtp_port']) as server:
-            server.starttls()
-            server.login(config['email_username'], config['email_password'])
-            server.send_message(msg)
-        
-        logging.info("Email alert sent with detailed metrics")
+        # Hand off to the background worker so SMTP never blocks sampling
+        start_email_worker(config)
+        email_queue.put_nowait(msg)
 
+    except queue.Full:
+        logging.error("Email queue full. Dropping email alert.")
     except Exception as e:
-        logging.error(f"Failed to send email alert: {e}")
+        logging.error("Failed to send email alert: %s", e)
 
 def monitor(config, logger):
     """Main monitoring loop"""
     last_alert_time = 0
     alert_cooldown = 300  # 5 minutes between alerts
     
-    # Initialize network history
-    get_network_rates()
+    # Prime the CPU and network snapshots; each cycle then measures since the last one
+    sample = sample_system()
+    get_network_rates(sample['bytes_sent'], sample['bytes_recv'])
     
-    logger.info(f"Monitoring started on {config['hostname']}")
-    logger.info(f"Thresholds - CPU: {config['cpu_threshold']}% | Memory: {config['mem_threshold']}% | "
-                f"Disk: {config['disk_threshold']}% | Net Sent: {config['net_sent_threshold']}MB/s | "
-                f"Net Recv: {config['net_recv_threshold']}MB/s")
+    logger.info("Monitoring started on %s", config['hostname'])
+    logger.info("Thresholds - CPU: %s%% | Memory: %s%% | Disk: %s%% | Net Sent: %sMB/s | Net Recv: %sMB/s",
+                config['cpu_threshold'], config['mem_threshold'], config['disk_threshold'],
+                config['net_sent_threshold'], config['net_recv_threshold'])
+
+    # Colors are only useful on a terminal; colorama strips them from pipes and the journal anyway
+    colored_output = sys.stdout.isatty()
+    log_info = logger.isEnabledFor(logging.INFO)
+
+    # Schedule cycles on a fixed monotonic grid so per-cycle work doesn't add drift
+    next_deadline = time.monotonic() + config['interval']
+    time.sleep(config['interval'])
 
     while True:
         # Collect metrics
-        cpu = psutil.cpu_percent(interval=1)
-        memory = psutil.virtual_memory().percent
-        disk = psutil.disk_usage('/').percent
-        net_sent, net_recv = get_network_rates()
+        sample = sample_system()
+        cpu = sample['cpu']
+        memory = sample['memory']
+        disk = sample['disk']
+        net_sent, net_recv = get_network_rates(sample['bytes_sent'], sample['bytes_recv'])
         
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        timestamp = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime())
         metrics = {
             'cpu': cpu,
             'memory': memory,
@@ -360,47 +629,45 @@ def monitor(config, logger):
             'net_recv': net_recv
         }
 
-        # Colorize output
-        cpu_col = colorize(cpu, config['cpu_threshold'])
-        mem_col = colorize(memory, config['mem_threshold'])
-        disk_col = colorize(disk, config['disk_threshold'])
-        net_sent_col = colorize(net_sent, config['net_sent_threshold'])
-        net_recv_col = colorize(net_recv, config['net_recv_threshold'])
-
         # Console output
-        output = (f"[{timestamp}] CPU: {cpu_col}% | Mem: {mem_col}% | Disk: {disk_col}% | "
+        if colored_output:
+            cpu_col = colorize(cpu, config['cpu_threshold'])
+            mem_col = colorize(memory, config['mem_threshold'])
+            disk_col = colorize(disk, config['disk_threshold'])
+            net_sent_col = colorize(net_sent, config['net_sent_threshold'])
+            net_recv_col = colorize(net_recv, config['net_recv_threshold'])
+            print(f"[{timestamp}] CPU: {cpu_col}% | Mem: {mem_col}% | Disk: {disk_col}% | "
                   f"Net: ↑{net_sent_col} MB/s ↓{net_recv_col} MB/s")
-        print(output)
+        else:
+            print(f"[{timestamp}] CPU: {cpu}% | Mem: {memory}% | Disk: {disk}% | "
+                  f"Net: ↑{net_sent} MB/s ↓{net_recv} MB/s")
         
         # Log entry in requested format
-        log_entry = (f"CPU: {cpu}% | Memory: {memory}% | Disk: {disk}% | "
-                     f"Net Sent: {net_sent:.2f} MB/s | Net Recv: {net_recv:.2f} MB/s")
-        logger.info(log_entry)
+        if log_info:
+            logger.info("CPU: %s%% | Memory: %s%% | Disk: %s%% | Net Sent: %.2f MB/s | Net Recv: %.2f MB/s",
+                        cpu, memory, disk, net_sent, net_recv)
 
         # Check thresholds and send alerts
         current_time = time.time()
-        alerts = []
-        
-        if cpu > config['cpu_threshold']:
-            alerts.append(f"High CPU usage: {cpu:.1f}%")
-        if memory > config['mem_threshold']:
-            alerts.append(f"High Memory usage: {memory:.1f}%")
-        if disk > config['disk_threshold']:
-            alerts.append(f"High Disk usage: {disk:.1f}%")
-        if net_sent > config['net_sent_threshold']:
-            alerts.append(f"High Network send rate: {net_sent:.2f} MB/s")
-        if net_recv > config['net_recv_threshold']:
-            alerts.append(f"High Network receive rate: {net_recv:.2f} MB/s")
+        alerts = check_thresholds(config, metrics)
 
         # Send alert if needed
         if alerts and (current_time - last_alert_time) > alert_cooldown:
-            logger.warning(f"ALERT: {', '.join(alerts)}")
-            send_email_alert(config, metrics, alerts)
+            logger.warning("ALERT: %s", ', '.join(alerts))
+            if config['email_enabled']:
+                send_email_alert(config, metrics, alerts)
             last_alert_time = current_time
 
-        time.sleep(config['interval'])
+        next_deadline += config['interval']
+        delay = next_deadline - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+        else:
+            # Cycle overran the interval (blocked stdout/log I/O, process stopped), realign instead of catching up
+            next_deadline = time.monotonic()
 
-if __name__ == '__main__':
+def main():
+    """Parse command line arguments and run the monitor"""
     # Create a temporary logger first for error handling
     temp_logger = logging.getLogger('TempLogger')
     temp_logger.setLevel(logging.INFO)
@@ -411,6 +678,8 @@ if __name__ == '__main__':
         parser.add_argument('--gen-config', action='store_true', help='Generate default config file')
         parser.add_argument('--test-email', action='store_true', help='Send a test email')
         parser.add_argument('--config', default='/etc/system_monitor.conf', help='Path to config file')
+        parser.add_argument('--pin-cpu', type=int, nargs='?', const=0, metavar='CPU',
+                            help='Pin the monitor to one CPU (default 0) for steadier sampling')
         args = parser.parse_args()
 
         if args.gen_config:
@@ -423,6 +692,9 @@ if __name__ == '__main__':
         config = load_config()
         logger = setup_logger(config)
         
+        if args.pin_cpu is not None:
+            os.sched_setaffinity(0, {args.pin_cpu})
+        
         if args.test_email:
             print("Sending test email...")
             test_metrics = {
@@ -438,6 +710,8 @@ if __name__ == '__main__':
                 "Test Alert: High Network send rate"
             ]
             send_email_alert(config, test_metrics, test_alerts)
+            # Wait for the background worker before exiting
+            email_queue.join()
             print("Test email sent successfully")
             exit(0)
         
@@ -463,3 +737,9 @@ if __name__ == '__main__':
             temp_logger.exception("Critical error occurred")
         print(Fore.RED + f"Error: {str(e)}" + Style.RESET_ALL)
         exit(1)
+    
+    finally:
+        cleanup()
+
+if __name__ == '__main__':
+    main()
@@ -4,12 +4,21 @@ Unit tests for Linux System Monitor
 
 import unittest
 from unittest.mock import patch, MagicMock
+import importlib.util
 import sys
 import os
 
 # Add parent directory to path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+# monitor-linux.py is not an importable module name, load it from its path
+_spec = importlib.util.spec_from_file_location(
+    'monitor_linux',
+    os.path.join(os.path.dirname(__file__), '..', 'monitor-linux.py')
+)
+monitor_linux = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(monitor_linux)
+
 
 class TestSystemMonitor(unittest.TestCase):
     """Test cases for system monitoring functions"""
@@ -51,6 +60,17 @@ class TestSystemMonitor(unittest.TestCase):
         # Add your network monitoring test logic here
         self.assertIsNotNone(mock_network)
 
+    @patch('time.monotonic_ns')
+    def test_network_rates_use_previous_sample(self, mock_clock):
+        """Test rates are computed against the previous sample only"""
+        monitor_linux.net_prev['initialized'] = False
+        mock_clock.return_value = 100 * 10**9
+        self.assertEqual(monitor_linux.get_network_rates(0, 0), (0.0, 0.0))
+        mock_clock.return_value = 105 * 10**9
+        self.assertEqual(monitor_linux.get_network_rates(5 * 1048576, 10 * 1048576), (1.0, 2.0))
+        mock_clock.return_value = 110 * 10**9
+        self.assertEqual(monitor_linux.get_network_rates(5 * 1048576, 20 * 1048576), (0.0, 2.0))
+
     @patch('psutil.process_iter')
     def test_process_monitoring(self, mock_processes):
         """Test process monitoring"""
@@ -61,6 +81,121 @@ class TestSystemMonitor(unittest.TestCase):
         self.assertIsNotNone(mock_processes)
 
 
+class TestSystemSampling(unittest.TestCase):
+    """Test cases for direct /proc sampling"""
+
+    def setUp(self):
+        """Start each test with no open /proc files and an empty disk cache"""
+        monitor_linux.cleanup()
+        monitor_linux.disk_cache['timestamp'] = None
+
+    def tearDown(self):
+        """Close /proc files and drop cached disk usage left by the test"""
+        monitor_linux.cleanup()
+        monitor_linux.disk_cache['timestamp'] = None
+
+    def test_sample_system(self):
+        """Test a non-blocking sample returns sane values"""
+        sample = monitor_linux.sample_system()
+        for key in ('cpu', 'memory', 'disk'):
+            self.assertGreaterEqual(sample[key], 0.0)
+            self.assertLessEqual(sample[key], 100.0)
+        self.assertGreaterEqual(sample['bytes_sent'], 0)
+        self.assertGreaterEqual(sample['bytes_recv'], 0)
+
+    @patch('os.statvfs')
+    def test_disk_usage_cached(self, mock_statvfs):
+        """Test statvfs is not called again within the cache TTL"""
+        mock_statvfs.return_value = MagicMock(f_blocks=100, f_bfree=40, f_bavail=30, f_frsize=4096)
+        monitor_linux.disk_cache['timestamp'] = None
+        self.assertEqual(monitor_linux.read_disk_percent('/'), 66.7)
+        self.assertEqual(monitor_linux.read_disk_percent('/'), 66.7)
+        mock_statvfs.assert_called_once()
+
+    def test_memory_percent_without_memavailable(self):
+        """Test memory usage falls back to MemFree + Buffers + Cached on old kernels"""
+        meminfo = (b'MemTotal:        1000 kB\nMemFree:          300 kB\n'
+                   b'Buffers:          100 kB\nCached:           200 kB\nSwapCached:       400 kB\n')
+        with patch.object(monitor_linux, 'read_proc', return_value=memoryview(bytearray(meminfo))):
+            self.assertEqual(monitor_linux.read_memory_percent(), 40.0)
+        with patch.object(monitor_linux, 'read_proc', return_value=memoryview(bytearray(b'MemFree: 1 kB\n'))):
+            self.assertEqual(monitor_linux.read_memory_percent(), 0.0)
+
+    def test_proc_fds_reused(self):
+        """Test /proc files are read through persistent descriptors until cleanup"""
+        monitor_linux.read_proc('/proc/stat')
+        fd = monitor_linux.proc_fds['/proc/stat']
+        self.assertTrue(monitor_linux.read_proc('/proc/stat').tobytes().startswith(b'cpu '))
+        self.assertEqual(monitor_linux.proc_fds['/proc/stat'], fd)
+        monitor_linux.cleanup()
+        self.assertEqual(monitor_linux.proc_fds, {})
+        self.assertEqual(monitor_linux.proc_bufs, {})
+
+    def test_proc_short_reads_assembled(self):
+        """Test short seq_file-style reads are assembled and the buffer grows to fit"""
+        content = b''.join(b'if%d: %d 0 0 0 0 0 0 0 %d 0\n' % (i, i, i) for i in range(20))
+
+        def short_preadv(fd, buffers, offset):
+            # Return at most 7 bytes per read, like a seq_file returning one page at a time
+            chunk = content[offset:offset + min(7, len(buffers[0]))]
+            buffers[0][:len(chunk)] = chunk
+            return len(chunk)
+
+        with patch.object(monitor_linux, 'PROC_BUFFER_SIZE', 16), \
+                patch('os.preadv', side_effect=short_preadv):
+            data = monitor_linux.read_proc('/proc/net/dev').tobytes()
+            buffer_size = len(monitor_linux.proc_bufs['/proc/net/dev'])
+        monitor_linux.cleanup()
+        self.assertEqual(data, content)
+        self.assertGreaterEqual(buffer_size, len(content))
+
+
+class TestEmailDelivery(unittest.TestCase):
+    """Test cases for background email delivery"""
+
+    @patch('smtplib.SMTP')
+    def test_send_is_queued(self, mock_smtp):
+        """Test alerts are delivered by the worker thread, not the caller"""
+        config = {
+            'email_sender': 'a@example.com', 'email_receiver': 'b@example.com',
+            'email_subject': 'Alert', 'smtp_server': 'smtp.example.com',
+            'smtp_port': 587, 'email_username': 'a', 'email_password': 'secret',
+            'email_enabled': True, 'hostname': 'host', 'local_ip': '127.0.0.1', 'interval': 5,
+            'cpu_threshold': 85, 'mem_threshold': 80, 'disk_threshold': 90,
+            'net_sent_threshold': 10, 'net_recv_threshold': 10
+        }
+        metrics = {'cpu': 95.0, 'memory': 50.0, 'disk': 50.0, 'net_sent': 0.0, 'net_recv': 0.0}
+        monitor_linux.send_email_alert(config, metrics, ['High CPU usage: 95.0%'])
+        monitor_linux.email_queue.join()
+        self.assertIsNot(monitor_linux.email_worker, None)
+        mock_smtp.return_value.send_message.assert_called_once()
+
+    @patch('smtplib.SMTP')
+    def test_smtp_session_reused(self, mock_smtp):
+        """Test the SMTP connection is kept open and re-established after a disconnect"""
+        conn = mock_smtp.return_value
+        conn.noop.return_value = (250, b'OK')
+        session = monitor_linux.SmtpSession({
+            'smtp_server': 'smtp.example.com', 'smtp_port': 587,
+            'email_username': 'a', 'email_password': 'secret'
+        })
+        session.send(MagicMock())
+        session.send(MagicMock())
+        self.assertEqual(mock_smtp.call_count, 1)
+        self.assertEqual(conn.login.call_count, 1)
+
+        conn.noop.side_effect = monitor_linux.smtplib.SMTPServerDisconnected()
+        session.send(MagicMock())
+        self.assertEqual(mock_smtp.call_count, 2)
+        self.assertEqual(conn.send_message.call_count, 3)
+
+        conn.noop.side_effect = monitor_linux.socket.timeout()
+        session.send(MagicMock())
+        self.assertEqual(mock_smtp.call_count, 3)
+        self.assertEqual(conn.send_message.call_count, 4)
+        mock_smtp.assert_called_with('smtp.example.com', 587, timeout=monitor_linux.SMTP_TIMEOUT)
+
+
 class TestConfiguration(unittest.TestCase):
     """Test cases for configuration handling"""
 
@@ -78,6 +213,56 @@ class TestConfiguration(unittest.TestCase):
 class TestDataProcessing(unittest.TestCase):
     """Test cases for data processing and formatting"""
 
+    def test_parse_uint(self):
+        """Test integer parsing from raw /proc buffers"""
+        buf = memoryview(b'cpu  1290 0 357\nMemTotal:  6147400 kB\n')
+        self.assertEqual(monitor_linux.parse_uint(buf, 3), (1290, 9))
+        self.assertEqual(monitor_linux.parse_uint(buf, 9), (0, 11))
+        self.assertEqual(monitor_linux.parse_uint(buf, 11), (357, 15))
+        self.assertEqual(monitor_linux.parse_uint(buf, 25)[0], 6147400)
+
+    def test_html_template(self):
+        """Test the email template renders with precomputed status cells"""
+        html = monitor_linux.HTML_TEMPLATE % {
+            'hostname': 'host', 'local_ip': '127.0.0.1', 'time': 'now',
+            'alerts_section': '<p>No active alerts</p>', 'interval': 5,
+            'metric_rows': monitor_linux.METRIC_ROW_TEMPLATE % {
+                'row_style': '', 'label': 'CPU Usage', 'value': '50.0%',
+                'threshold': '85%', 'status': monitor_linux.status_cell(50.0, 85)
+            }
+        }
+        self.assertIn('width: 100%;', html)
+        self.assertIn('50.0%', html)
+        self.assertIn(monitor_linux.STATUS_NORMAL, html)
+        self.assertIs(monitor_linux.status_cell(95, 90), monitor_linux.STATUS_CRITICAL)
+        self.assertIs(monitor_linux.status_cell(85, 90), monitor_linux.STATUS_WARNING)
+
+    def test_check_thresholds(self):
+        """Test alerts are raised only for metrics above their threshold"""
+        config = {
+            'cpu_threshold': 85, 'mem_threshold': 80, 'disk_threshold': 90,
+            'net_sent_threshold': 10, 'net_recv_threshold': 10
+        }
+        metrics = {'cpu': 95.0, 'memory': 50.0, 'disk': 50.0, 'net_sent': 12.345, 'net_recv': 0.0}
+        self.assertEqual(monitor_linux.check_thresholds(config, metrics),
+                         ['High CPU usage: 95.0%', 'High Network send rate: 12.35 MB/s'])
+
+    def test_colorize(self):
+        """Test console colors follow the threshold bands"""
+        Fore = monitor_linux.Fore
+        self.assertTrue(monitor_linux.colorize(50.0, 85).startswith(Fore.GREEN + '50.0'))
+        self.assertTrue(monitor_linux.colorize(80.0, 85).startswith(Fore.YELLOW + '80.0'))
+        self.assertTrue(monitor_linux.colorize(90.0, 85).startswith(Fore.RED + '90.0'))
+
+    def test_net_dev_parsing(self):
+        """Test interface counters are summed from /proc/net/dev lines"""
+        data = (b'Inter-|   Receive                                                |  Transmit\n'
+                b' face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets\n'
+                b'    lo:  583281     163    0    0    0     0          0         0   583281     163    0    0\n'
+                b'  eth0:12345678901  137    0    0    0     0          0         0    18114     134    0    0\n')
+        matches = [m.groups() for m in monitor_linux.NET_DEV_RE.finditer(memoryview(data))]
+        self.assertEqual(matches, [(b'583281', b'583281'), (b'12345678901', b'18114')])
+
     def test_percentage_formatting(self):
         """Test percentage value formatting"""
         # Add percentage formatting test logic here